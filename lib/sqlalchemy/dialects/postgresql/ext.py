@@ -7,6 +7,7 @@
 # mypy: ignore-errors
 from __future__ import annotations
 
+import sys
 from typing import Any
 from typing import Sequence
 from typing import TYPE_CHECKING
@@ -71,6 +72,8 @@ class aggregate_order_by(expression.ColumnElement):
     __visit_name__ = "aggregate_order_by"
 
     stringify_dialect = "postgresql"
+    inherit_cache = True
+
     _traverse_internals: _TraverseInternalsType = [
         ("target", InternalTraversal.dp_clauseelement),
         ("type", InternalTraversal.dp_type),
@@ -218,11 +221,20 @@ class ExcludeConstraint(ColumnCollectionConstraint):
             PostgreSQL operator classes are specified.
 
         """
+        if not elements:
+            raise exc.ArgumentError(
+                "ExcludeConstraint requires at least one "
+                "(expression, operator) element"
+            )
+
         columns = []
         render_exprs = []
-        self.operators = {}
 
-        expressions, operators = zip(*elements)
+        expressions = []
+        operators = []
+        for expr, operator in elements:
+            expressions.append(expr)
+            operators.append(operator)
 
         for (expr, column, strname, add_element), operator in zip(
             coercions.expect_col_expression_collection(
@@ -235,13 +247,21 @@ class ExcludeConstraint(ColumnCollectionConstraint):
 
             name = column.name if column is not None else strname
 
-            if name is not None:
-                # backwards compat
-                self.operators[name] = operator
+            if isinstance(operator, str):
+                operator = sys.intern(operator)
 
             render_exprs.append((expr, name, operator))
 
-        self._render_exprs = render_exprs
+        # backwards compat
+        self.operators = {
+            name: operator
+            for _, name, operator in render_exprs
+            if name is not None
+        }
+        self._render_exprs = tuple(render_exprs)
+        self._has_str_exprs = any(
+            isinstance(expr, str) for expr, _, _ in render_exprs
+        )
 
         ColumnCollectionConstraint.__init__(
             self,
@@ -260,23 +280,32 @@ class ExcludeConstraint(ColumnCollectionConstraint):
     def _set_parent(self, table, **kw):
         super()._set_parent(table)
 
-        self._render_exprs = [
+        if not self._has_str_exprs:
+            return
+
+        self._render_exprs = tuple(
             (
                 expr if not isinstance(expr, str) else table.c[expr],
                 name,
                 operator,
             )
             for expr, name, operator in (self._render_exprs)
-        ]
+        )
+        self._has_str_exprs = False
 
     def _copy(self, target_table=None, **kw):
-        elements = [
-            (
-                schema._copy_expression(expr, self.parent, target_table),
-                operator,
-            )
-            for expr, _, operator in self._render_exprs
-        ]
+        if target_table is None or target_table is self.parent:
+            elements = [
+                (expr, operator) for expr, _, operator in self._render_exprs
+            ]
+        else:
+            elements = [
+                (
+                    schema._copy_expression(expr, self.parent, target_table),
+                    operator,
+                )
+                for expr, _, operator in self._render_exprs
+            ]
         c = self.__class__(
             *elements,
             name=self.name,
@@ -304,12 +333,16 @@ class _regconfig_fn(functions.GenericFunction[_T]):
     inherit_cache = True
 
     def __init__(self, *args, **kwargs):
+        expect = coercions.expect
+        role = roles.ExpressionElementRole
+        name = getattr(self, "name", None)
+
         args = list(args)
         if len(args) > 1:
-            initial_arg = coercions.expect(
-                roles.ExpressionElementRole,
+            initial_arg = expect(
+                role,
                 args.pop(0),
-                name=getattr(self, "name", None),
+                name=name,
                 apply_propagate_attrs=self,
                 type_=types.REGCONFIG,
             )
@@ -318,12 +351,7 @@ class _regconfig_fn(functions.GenericFunction[_T]):
             initial_arg = []
 
         addtl_args = [
-            coercions.expect(
-                roles.ExpressionElementRole,
-                c,
-                name=getattr(self, "name", None),
-                apply_propagate_attrs=self,
-            )
+            expect(role, c, name=name, apply_propagate_attrs=self)
             for c in args
         ]
         super().__init__(*(initial_arg + addtl_args), **kwargs)
@@ -461,6 +489,10 @@ class ts_headline(_regconfig_fn):
     type = TEXT
 
     def __init__(self, *args, **kwargs):
+        expect = coercions.expect
+        role = roles.ExpressionElementRole
+        name = getattr(self, "name", None)
+
         args = list(args)
 
         # parse types according to
@@ -478,11 +510,11 @@ class ts_headline(_regconfig_fn):
             has_regconfig = True
 
         if has_regconfig:
-            initial_arg = coercions.expect(
-                roles.ExpressionElementRole,
+            initial_arg = expect(
+                role,
                 args.pop(0),
                 apply_propagate_attrs=self,
-                name=getattr(self, "name", None),
+                name=name,
                 type_=types.REGCONFIG,
             )
             initial_arg = [initial_arg]
@@ -490,12 +522,7 @@ class ts_headline(_regconfig_fn):
             initial_arg = []
 
         addtl_args = [
-            coercions.expect(
-                roles.ExpressionElementRole,
-                c,
-                name=getattr(self, "name", None),
-                apply_propagate_attrs=self,
-            )
+            expect(role, c, name=name, apply_propagate_attrs=self)
             for c in args
         ]
         super().__init__(*(initial_arg + addtl_args), **kwargs)
@@ -526,10 +553,17 @@ class DistinctOnClause(SyntaxExtension, expression.ClauseElement):
     ]
 
     def __init__(self, distinct_on: Sequence[_ColumnExpressionArgument[Any]]):
-        self._distinct_on = tuple(
-            coercions.expect(roles.ByOfRole, e, apply_propagate_attrs=self)
-            for e in distinct_on
-        )
+        expect = coercions.expect
+        role = roles.ByOfRole
+        if len(distinct_on) == 1:
+            self._distinct_on = (
+                expect(role, distinct_on[0], apply_propagate_attrs=self),
+            )
+        else:
+            self._distinct_on = tuple(
+                expect(role, e, apply_propagate_attrs=self)
+                for e in distinct_on
+            )
 
     def apply_to_select(self, select_stmt: expression.Select[Any]) -> None:
         if select_stmt._distinct_on:
@@ -548,14 +582,15 @@ class DistinctOnClause(SyntaxExtension, expression.ClauseElement):
         self, existing: Sequence[elements.ClauseElement]
     ) -> Sequence[elements.ClauseElement]:
         res = []
-        to_merge = ()
+        to_merge = []
+        cls = DistinctOnClause
         for e in existing:
-            if isinstance(e, DistinctOnClause):
-                to_merge += e._distinct_on
+            if isinstance(e, cls):
+                to_merge.extend(e._distinct_on)
             else:
                 res.append(e)
         if to_merge:
-            res.append(DistinctOnClause(to_merge + self._distinct_on))
+            res.append(cls(tuple(to_merge) + self._distinct_on))
         else:
             res.append(self)
         return res
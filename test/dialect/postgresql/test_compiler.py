@@ -1295,6 +1295,30 @@ class CompileTest(fixtures.TestBase, AssertsCompiledSQL):
             "ALTER TABLE testtbl ADD EXCLUDE USING gist (room WITH =)",
         )
 
+    def test_exclude_constraint_copy_same_table(self):
+        m = MetaData()
+        tbl = Table("testtbl", m, Column("x", Integer), Column("y", Integer))
+        cons = ExcludeConstraint(
+            (func.int8range(tbl.c.x, tbl.c.y), "&&"), ("y", "=")
+        )
+        tbl.append_constraint(cons)
+
+        cons_copy = cons._copy(target_table=tbl)
+        tbl.append_constraint(cons_copy)
+        self.assert_compile(
+            schema.AddConstraint(cons_copy),
+            "ALTER TABLE testtbl ADD EXCLUDE USING gist "
+            "(int8range(x, y) WITH &&, y WITH =)",
+        )
+
+    def test_exclude_constraint_no_elements(self):
+        with expect_raises_message(
+            exc.ArgumentError,
+            r"ExcludeConstraint requires at least one "
+            r"\(expression, operator\) element",
+        ):
+            ExcludeConstraint()
+
     def test_exclude_constraint_copy_complex(self):
         m = MetaData()
         tbl = Table("foo", m, Column("x", Integer), Column("y", Integer))
@@ -4114,6 +4138,22 @@ class FullTextSearchTest(fixtures.TestBase, AssertsCompiledSQL):
                 dialect="postgresql+asyncpg",
             )
 
+    def test_ts_headline_tsquery_type_decorator(self):
+        class MyTSQuery(sqltypes.TypeDecorator):
+            impl = TSQUERY
+            cache_ok = True
+
+        stmt = select(
+            func.ts_headline(
+                "some text", literal("query & similarity", MyTSQuery)
+            )
+        )
+        self.assert_compile(
+            stmt,
+            "SELECT ts_headline($1::VARCHAR, $2) AS ts_headline_1",
+            dialect="postgresql+asyncpg",
+        )
+
 
 class RegexpTest(fixtures.TestBase, testing.AssertsCompiledSQL):
     __dialect__ = "postgresql"